@@ -162,6 +162,81 @@ Note: This requires the actual TFLite model file to be placed in assets/
     logger.info("   ✅ COMPLETED: create_tflite_wrapper")
 
 
+def convert_via_ai_edge_torch(model_path: str, output_dir: str):
+    """
+    Convert PyTorch -> TFLite directly with ai-edge-torch (no ONNX detour)
+
+    Google's ai-edge-torch takes the nn.Module straight to a TFLite
+    flatbuffer with XNNPACK kernels, skipping the two-hop
+    ONNX -> onnx-tf -> TFLite pipeline and its op-set mismatch failure
+    modes. Returns False when the package is not installed so callers
+    can fall back to the ONNX path.
+    """
+    logger.info("=" * 60)
+    logger.info("🚀 STARTING: convert_via_ai_edge_torch")
+    logger.info(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"📂 Model path: {model_path}")
+    logger.info(f"📂 Output dir: {output_dir}")
+    logger.info("=" * 60)
+    start_time = time.time()
+
+    try:
+        logger.info("🔍 Checking ai-edge-torch availability...")
+        import ai_edge_torch
+        logger.info("   ✅ ai-edge-torch available")
+    except ImportError as e:
+        logger.warning(f"⚠️  ai-edge-torch not available: {e}")
+        logger.info("   Install: pip install ai-edge-torch")
+        return False
+
+    logger.info("   Loading PyTorch model...")
+    predictor = DistilBertPredictor(model_path)
+    model = predictor.model
+    model.eval()
+    logger.info("✅ Model loaded")
+
+    # ai-edge-torch needs tensor (not dict) outputs, same as TorchScript
+    class TupleWrapper(torch.nn.Module):
+        """Return the per-task logits as a tuple in task-head order"""
+        def __init__(self, base_model):
+            super().__init__()
+            self.base_model = base_model
+            self.task_order = list(base_model.task_heads.keys())
+
+        def forward(self, input_ids, attention_mask):
+            outputs = self.base_model(input_ids=input_ids, attention_mask=attention_mask)
+            predictions = outputs['predictions']
+            return tuple(predictions[task] for task in self.task_order)
+
+    wrapper = TupleWrapper(model)
+    wrapper.eval()
+    logger.info(f"   Task order: {wrapper.task_order}")
+
+    dummy_input_ids = torch.randint(0, 1000, (1, 128), dtype=torch.long)
+    dummy_attention_mask = torch.ones(1, 128, dtype=torch.long)
+
+    logger.info("   🚀 Converting PyTorch -> TFLite (single hop)...")
+    logger.info("   ⏳ This may take several minutes...")
+    try:
+        edge_model = ai_edge_torch.convert(wrapper, (dummy_input_ids, dummy_attention_mask))
+        os.makedirs(output_dir, exist_ok=True)
+        tflite_path = os.path.join(output_dir, "distilbert_model.tflite")
+        edge_model.export(tflite_path)
+    except Exception as e:
+        logger.error(f"❌ ai-edge-torch conversion failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+    elapsed = time.time() - start_time
+    file_size_mb = os.path.getsize(tflite_path) / (1024 * 1024)
+    logger.info("=" * 60)
+    logger.info(f"✅ COMPLETED: convert_via_ai_edge_torch in {elapsed:.1f}s")
+    logger.info(f"📱 TFLite model ready: {tflite_path} ({file_size_mb:.2f} MB)")
+    logger.info("=" * 60)
+    return True
+
+
 def convert_via_onnx(model_path: str, output_dir: str):
     """
     Convert via ONNX (requires onnx and onnx-tf packages)
@@ -204,6 +279,10 @@ def convert_via_onnx(model_path: str, output_dir: str):
     logger.info(f"   🚀 Starting ONNX export to {onnx_path}...")
     logger.info("   ⏳ This may take several minutes...")
     try:
+        # Opset 17 exports LayerNormalization as one op instead of ~8
+        # decomposed ones, and constant folding collapses the attention
+        # mask broadcasts at export time - smaller graph, less work for
+        # every downstream converter
         torch.onnx.export(
             predictor.model,
             dummy_input,
@@ -212,7 +291,11 @@ def convert_via_onnx(model_path: str, output_dir: str):
             output_names=['category', 'transaction_type', 'intent'],
             dynamic_axes={
                 'input_ids': {0: 'batch_size'},
-            }
+            },
+            opset_version=17,
+            do_constant_folding=True,
+            export_params=True,
+            training=torch.onnx.TrainingMode.EVAL
         )
         step1_elapsed = time.time() - step1_start
         file_size = os.path.getsize(onnx_path) / (1024 * 1024)
@@ -234,7 +317,23 @@ def convert_via_onnx(model_path: str, output_dir: str):
     logger.info("   Validating ONNX model...")
     onnx.checker.check_model(onnx_model)
     logger.info("   ✅ ONNX model is valid")
-    
+
+    # Optional: fuse residual ops left over after constant folding
+    try:
+        import onnxsim
+        logger.info("   Simplifying ONNX graph with onnxsim...")
+        simplified_model, check_ok = onnxsim.simplify(onnx_model)
+        if check_ok:
+            onnx.save(simplified_model, onnx_path)
+            onnx_model = simplified_model
+            logger.info("   ✅ Graph simplified")
+        else:
+            logger.warning("   ⚠️  Simplified graph failed validation, keeping original")
+    except ImportError:
+        logger.info("   💡 onnxsim not installed, skipping graph simplification")
+    except Exception as e:
+        logger.warning(f"   ⚠️  Graph simplification failed: {e}")
+
     logger.info("   🚀 Converting to TensorFlow (this may take several minutes)...")
     tf_rep = onnx_tf.backend.prepare(onnx_model)
     tf_model_path = os.path.join(output_dir, "tf_model")
@@ -277,6 +376,81 @@ def convert_via_onnx(model_path: str, output_dir: str):
     return True
 
 
+def convert_via_onnx_mobile(model_path: str, output_dir: str):
+    """
+    Export ONNX and quantize it for ONNX Runtime Mobile (no TF hops)
+
+    ORT Mobile consumes the ONNX directly on-device; loading it with
+    providers=['CoreMLExecutionProvider', 'NNAPIExecutionProvider',
+    'CPUExecutionProvider'] dispatches attention to the iOS/Android
+    accelerator with CPU fallback. Returns True on success.
+    """
+    logger.info("=" * 60)
+    logger.info("🚀 STARTING: convert_via_onnx_mobile")
+    logger.info(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"📂 Model path: {model_path}")
+    logger.info(f"📂 Output dir: {output_dir}")
+    logger.info("=" * 60)
+    start_time = time.time()
+
+    try:
+        logger.info("🔍 Checking ONNX Runtime quantization availability...")
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        logger.info("   ✅ onnxruntime.quantization available")
+    except ImportError as e:
+        logger.error(f"⚠️  ONNX Runtime not available: {e}")
+        logger.info("   Install: pip install onnxruntime")
+        return False
+
+    logger.info("   Loading PyTorch model...")
+    predictor = DistilBertPredictor(model_path)
+    logger.info("✅ Model loaded")
+
+    os.makedirs(output_dir, exist_ok=True)
+    onnx_path = os.path.join(output_dir, "model.onnx")
+    onnx_int8_path = os.path.join(output_dir, "distilbert_model.int8.onnx")
+
+    dummy_input = torch.randint(0, 1000, (1, 128))
+    logger.info(f"   🚀 Exporting ONNX to {onnx_path}...")
+    try:
+        torch.onnx.export(
+            predictor.model,
+            dummy_input,
+            onnx_path,
+            input_names=['input_ids'],
+            output_names=['category', 'transaction_type', 'intent'],
+            dynamic_axes={
+                'input_ids': {0: 'batch_size'},
+            },
+            opset_version=17,
+            do_constant_folding=True,
+            export_params=True,
+            training=torch.onnx.TrainingMode.EVAL
+        )
+    except Exception as e:
+        logger.error(f"❌ ONNX export failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+    logger.info(f"   🚀 Quantizing to INT8: {onnx_int8_path}...")
+    quantize_dynamic(onnx_path, onnx_int8_path, weight_type=QuantType.QInt8)
+
+    elapsed = time.time() - start_time
+    int8_mb = os.path.getsize(onnx_int8_path) / (1024 * 1024)
+    logger.info("=" * 60)
+    logger.info(f"✅ COMPLETED: convert_via_onnx_mobile in {elapsed:.1f}s")
+    logger.info(f"📱 INT8 ONNX model ready: {onnx_int8_path} ({int8_mb:.2f} MB)")
+    logger.info("")
+    logger.info("📋 On-device loading:")
+    logger.info("   ort.InferenceSession(path, providers=[")
+    logger.info("       'CoreMLExecutionProvider',   # iOS NPU")
+    logger.info("       'NNAPIExecutionProvider',    # Android NPU/DSP")
+    logger.info("       'CPUExecutionProvider'])     # fallback")
+    logger.info("=" * 60)
+    return True
+
+
 def quantize_model(tflite_path: str):
     """
     Apply post-training quantization to reduce model size
@@ -367,7 +541,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Use ONNX conversion path (requires onnx packages)"
     )
-    
+    parser.add_argument(
+        "--onnx_mobile",
+        action="store_true",
+        help="Export INT8 ONNX for ONNX Runtime Mobile (CoreML/NNAPI) instead of TFLite"
+    )
+
     args = parser.parse_args()
     
     logger.info(f"\n📋 Arguments:")
@@ -378,7 +557,10 @@ if __name__ == "__main__":
     
     script_start = time.time()
     
-    if args.use_onnx:
+    if args.onnx_mobile:
+        logger.info("🎯 Using ONNX Runtime Mobile path")
+        convert_via_onnx_mobile(args.model_path, args.output_dir)
+    elif args.use_onnx:
         logger.info("🎯 Using ONNX conversion path")
         success = convert_via_onnx(args.model_path, args.output_dir)
         if success:
@@ -386,7 +568,10 @@ if __name__ == "__main__":
             quantize_model(tflite_path)
     else:
         logger.info("🎯 Using direct conversion path")
-        convert_pytorch_to_tflite(args.model_path, args.output_dir)
+        # Prefer the single-hop ai-edge-torch conversion; fall back to the
+        # legacy flow when the package is not installed
+        if not convert_via_ai_edge_torch(args.model_path, args.output_dir):
+            convert_pytorch_to_tflite(args.model_path, args.output_dir)
     
     script_elapsed = time.time() - script_start
     logger.info("\n" + "=" * 60)
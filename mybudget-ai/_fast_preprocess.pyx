@@ -0,0 +1,149 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional Cython accelerator for preprocess_upi_narration.
+
+fast_clean() replaces the mechanical middle of the pipeline — bank-tag
+stripping after '@' (step 2) and transaction-ID junk removal (steps 3-6)
+— with a hand-rolled scanner that walks the string in C instead of
+dispatching several re.sub calls per narration. It only handles the
+common shapes (ASCII text, dash/slash/whitespace digit runs, simple
+bank tags) and returns None for anything it does not model exactly
+(dots, PAYTM identifiers, long mixed alphanumeric codes, non-ASCII);
+the caller then falls back to the regex pipeline, so behaviour is
+byte-for-byte identical either way.
+
+Build in place (requires Cython and a C compiler):
+
+    python3 setup_fast_preprocess.py build_ext --inplace
+
+preprocessing_utils picks the compiled module up automatically.
+"""
+
+
+cdef inline bint _is_digit(Py_UCS4 c):
+    return c >= u'0' and c <= u'9'
+
+
+cdef inline bint _is_alpha(Py_UCS4 c):
+    return (c >= u'A' and c <= u'Z') or (c >= u'a' and c <= u'z')
+
+
+cdef inline bint _is_alnum(Py_UCS4 c):
+    return _is_digit(c) or _is_alpha(c)
+
+
+cdef inline bint _is_space(Py_UCS4 c):
+    return c == u' ' or c == u'\t' or c == u'\n' or c == u'\r' or c == u'\f' or c == u'\v'
+
+
+cdef bint _must_bail(str s):
+    """True when the string may trigger a rule the scanner does not model."""
+    cdef Py_ssize_t i = 0, n = len(s), run_start
+    cdef Py_UCS4 c
+    cdef bint has_letter, has_digit
+    while i < n:
+        c = s[i]
+        if c >= 128:
+            return True          # non-ASCII: unicode \d/\s semantics differ
+        if c == u'.':
+            return True          # prefixed-number rule (FOO.171813425600), PAYTM.
+        if (c == u'p' or c == u'P') and i + 5 <= n:
+            # PAYTMQR identifiers are matched without dashes or dots
+            if s[i:i + 5].lower() == 'paytm':
+                return True
+        if _is_alnum(c):
+            # Long mixed alphanumeric runs can hit the clearing-code and
+            # 15+ char ID rules, whose leftmost-alternative interplay the
+            # scanner does not reproduce
+            run_start = i
+            has_letter = False
+            has_digit = False
+            while i < n and _is_alnum(s[i]):
+                if _is_digit(s[i]):
+                    has_digit = True
+                else:
+                    has_letter = True
+                i += 1
+            if has_letter and has_digit and i - run_start >= 14:
+                return True
+            continue
+        i += 1
+    return False
+
+
+cpdef fast_clean(str text):
+    """Steps 2-6 of the cleanup pipeline for plain (non-P2P) narrations.
+
+    Returns the cleaned string, or None when the input contains a shape
+    the scanner does not handle and the regex pipeline must run instead.
+    """
+    cdef Py_ssize_t n, i, j, at, tag_end, kept, digits
+    cdef Py_UCS4 c
+    cdef str before, after
+
+    if _must_bail(text):
+        return None
+
+    # Step 2: strip the bank tag after the first '@' (non-P2P branch of
+    # the regex pipeline: ^[A-Z0-9]+(?:-[A-Z0-9]+)* case-insensitive)
+    at = text.find(u'@')
+    if at >= 0:
+        before = text[:at]
+        after = text[at + 1:]
+        n = len(after)
+        tag_end = 0
+        while tag_end < n and _is_alnum(after[tag_end]):
+            tag_end += 1
+        if tag_end == 0:
+            # No bank-tag structure: drop '@' and everything after it
+            text = before
+        else:
+            while tag_end < n and after[tag_end] == u'-':
+                j = tag_end + 1
+                while j < n and _is_alnum(after[j]):
+                    j += 1
+                if j == tag_end + 1:
+                    break        # trailing dash is not part of the tag
+                tag_end = j
+            text = before + after[tag_end:]
+
+    # Steps 3-6: drop 9+ digit runs after dash/slash or whitespace,
+    # emitting everything else unchanged
+    n = len(text)
+    parts = []
+    kept = 0
+    i = 0
+    while i < n:
+        c = text[i]
+        if c == u'-' or c == u'/':
+            j = i + 1
+            while j < n and _is_digit(text[j]):
+                j += 1
+            digits = j - (i + 1)
+            if digits >= 9:
+                parts.append(text[kept:i])
+                kept = j
+                i = j
+                continue
+            if digits >= 6 and j < n and _is_alpha(text[j]):
+                return None      # zero-prefixed code rule (e.g. -000000RZVBRM)
+            i = j if digits > 0 else i + 1
+        elif _is_space(c):
+            j = i + 1
+            while j < n and _is_space(text[j]):
+                j += 1
+            digits = j
+            while digits < n and _is_digit(text[digits]):
+                digits += 1
+            if digits - j >= 9:
+                parts.append(text[kept:i])
+                kept = digits
+                i = digits
+                continue
+            i = j
+        else:
+            i += 1
+    if not parts:
+        return text
+    parts.append(text[kept:])
+    return ''.join(parts)
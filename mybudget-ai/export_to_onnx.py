@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+One-shot export of the trained multi-task DistilBERT to ONNX with int8
+dynamic quantization.
+
+Produces models/distilbert.onnx and models/distilbert.int8.onnx next to
+the saved checkpoint. inference_local.py picks up the int8 model at load
+time when onnxruntime is installed — ORT's fused attention kernels and
+VNNI int8 GEMM give a 2-5x faster CPU forward pass than eager PyTorch.
+
+Usage:
+    python3 export_to_onnx.py [model_dir]
+
+Default model_dir: models/distilbert_multitask_latest
+"""
+
+import json
+import os
+import sys
+
+import torch
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from train_distilbert import MultiTaskDistilBERT
+
+DEFAULT_MODEL_DIR = os.path.join(script_dir, "models", "distilbert_multitask_latest")
+ONNX_PATH = os.path.join(script_dir, "models", "distilbert.onnx")
+ONNX_INT8_PATH = os.path.join(script_dir, "models", "distilbert.int8.onnx")
+
+
+class _ExportWrapper(torch.nn.Module):
+    """Flatten the multi-task dict output into a tuple for ONNX export."""
+
+    def __init__(self, model, task_names):
+        super(_ExportWrapper, self).__init__()
+        self.model = model
+        self.task_names = task_names
+
+    def forward(self, input_ids, attention_mask):
+        out = self.model(input_ids=input_ids, attention_mask=attention_mask)
+        return tuple(out['predictions'][t] for t in self.task_names)
+
+
+def load_trained_model(model_dir: str):
+    """Rebuild MultiTaskDistilBERT from a saved checkpoint directory."""
+    with open(os.path.join(model_dir, 'config.json')) as f:
+        config = json.load(f)
+
+    tasks = config['tasks']
+    model = MultiTaskDistilBERT(model_dir, tasks)
+    heads_path = os.path.join(model_dir, 'task_heads.pt')
+    model.task_heads.load_state_dict(torch.load(heads_path, map_location='cpu'))
+    model.eval()
+    return model, config
+
+
+def export(model_dir: str = DEFAULT_MODEL_DIR):
+    sys.stderr.write(f"📦 Loading model from {model_dir}\n")
+    model, config = load_trained_model(model_dir)
+    task_names = list(config['tasks'].keys())
+    wrapper = _ExportWrapper(model, task_names)
+
+    max_length = config.get('max_length', 128)
+    dummy_ids = torch.ones(1, max_length, dtype=torch.long)
+    dummy_mask = torch.ones(1, max_length, dtype=torch.long)
+
+    sys.stderr.write(f"🔄 Exporting to {ONNX_PATH} (opset 17)\n")
+    torch.onnx.export(
+        wrapper,
+        (dummy_ids, dummy_mask),
+        ONNX_PATH,
+        opset_version=17,
+        do_constant_folding=True,
+        input_names=['input_ids', 'attention_mask'],
+        output_names=task_names,
+        dynamic_axes={
+            'input_ids': {0: 'batch', 1: 'sequence'},
+            'attention_mask': {0: 'batch', 1: 'sequence'},
+        },
+    )
+
+    sys.stderr.write(f"🔄 Quantizing to int8: {ONNX_INT8_PATH}\n")
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    quantize_dynamic(ONNX_PATH, ONNX_INT8_PATH, weight_type=QuantType.QInt8)
+
+    fp32_mb = os.path.getsize(ONNX_PATH) / (1024 * 1024)
+    int8_mb = os.path.getsize(ONNX_INT8_PATH) / (1024 * 1024)
+    sys.stderr.write(f"✅ Export complete: {fp32_mb:.1f} MB fp32, {int8_mb:.1f} MB int8\n")
+
+
+if __name__ == "__main__":
+    model_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODEL_DIR
+    export(model_dir)
@@ -23,15 +23,39 @@ Output: JSON to stdout
 
 import sys
 import json
+import mmap
 import os
 import logging
+import pickle
+import threading
 import warnings
 
+# Optional: orjson is ~3-5x faster than stdlib json for large payloads
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Suppress warnings for cleaner output
 logging.basicConfig(level=logging.WARNING)
 warnings.filterwarnings('ignore')
 os.environ['PYTHONWARNINGS'] = 'ignore'
 
+# Pin BLAS/OMP thread pools to physical cores (half the logical count)
+# BEFORE torch is imported below via distilbert_inference. Defaulting to
+# all logical cores makes DistilBERT inference slower, not faster, due to
+# cache contention between SMT siblings. Override via BUDGETBUDDY_THREADS.
+_NUM_THREADS = int(os.environ.get('BUDGETBUDDY_THREADS') or ((os.cpu_count() or 2) // 2 or 1))
+os.environ.setdefault('OMP_NUM_THREADS', str(_NUM_THREADS))
+os.environ.setdefault('MKL_NUM_THREADS', str(_NUM_THREADS))
+
 # Import DistilBERT inference module
 try:
     from distilbert_inference import get_predictor, clean_text
@@ -54,10 +78,27 @@ INCLUDE_PROBABILITIES = False
 # Load model on startup (singleton pattern)
 _predictor = None
 
+# Background model-load thread (started in main, joined before first use)
+_model_load_thread = None
+_model_load_error = None
+
 # User corrections cache (in-memory for fast lookup)
 _corrections_cache = None
+_corrections_lock = threading.Lock()
 CORRECTIONS_FILE = "user_corrections.json"
 
+# Resolved once at import: abspath(__file__) makes stat/readlink syscalls,
+# and daemon mode would otherwise redo them on every corrections reload
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CORRECTIONS_PATH = os.path.join(SCRIPT_DIR, CORRECTIONS_FILE)
+
+# Socket path for daemon mode (see run_daemon); override via env if needed
+DEFAULT_SOCKET_PATH = os.environ.get('BUDGETBUDDY_SOCKET', '/tmp/budgetbuddy.sock')
+
+# Opt-in pickle cache of the preprocessed corrections dict. Warm starts
+# skip JSON parsing and re-preprocessing every narration entirely.
+USE_PKL_CACHE = os.environ.get('BUDGETBUDDY_USE_PKL') == '1'
+
 
 def extract_category_parts(category: str) -> tuple:
     """
@@ -97,83 +138,116 @@ def load_corrections(force_reload=False):
         force_reload: If True, reload corrections even if already cached (default: False)
     """
     global _corrections_cache
-    
-    if _corrections_cache is None or force_reload:
-        _corrections_cache = {}
-        
-        # Get script directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        corrections_path = os.path.join(script_dir, CORRECTIONS_FILE)
-        
-        if os.path.exists(corrections_path):
-            try:
-                with open(corrections_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if content:
-                        corrections_data = json.loads(content)
-                        if isinstance(corrections_data, list):
-                            loaded_count = 0
-                            for correction in corrections_data:
-                                narration = correction.get("narration", "").strip()
-                                category = correction.get("category", "").strip()
-                                if narration and category:
-                                    # IMPORTANT: Corrections in JSON are now preprocessed using Python preprocessing_utils.
-                                    # Preprocess the narration when loading to ensure consistency.
-                                    # This ensures corrections match transactions that are also preprocessed with Python.
-                                    if PREPROCESSING_AVAILABLE:
-                                        preprocessed_narration = preprocess_upi_narration(narration, preserve_p2p_clues=True)
-                                    else:
-                                        # Fallback: use as-is
-                                        preprocessed_narration = narration.strip()
-                                    
-                                    # Only store if preprocessing didn't make it empty
-                                    if preprocessed_narration and preprocessed_narration.strip():
-                                        # Store in lowercase for case-insensitive matching
-                                        key = preprocessed_narration.lower().strip()
-                                        _corrections_cache[key] = category
-                                        loaded_count += 1
-                                    else:
-                                        # If preprocessing made it empty, store original (fallback)
-                                        key = narration.lower().strip()
-                                        _corrections_cache[key] = category
-                                        loaded_count += 1
-                            
-                            reload_msg = " (reloaded)" if force_reload else ""
-                            sys.stderr.write(f"✅ Loaded {loaded_count} user corrections into memory{reload_msg}\n")
+
+    # Lock so the background model-load thread and the main thread can
+    # both trigger loading without racing on a partially-built cache.
+    with _corrections_lock:
+        if _corrections_cache is None or force_reload:
+            _corrections_cache = {}
+
+            corrections_path = CORRECTIONS_PATH
+
+            pkl_path = corrections_path + '.pkl'
+            if (USE_PKL_CACHE and os.path.exists(corrections_path)
+                    and os.path.exists(pkl_path)
+                    and os.path.getmtime(pkl_path) >= os.path.getmtime(corrections_path)):
+                # Cache is at least as new as the JSON: load it and skip
+                # the parse + preprocess loop entirely
+                try:
+                    with open(pkl_path, 'rb') as f:
+                        _corrections_cache = pickle.load(f)
+                    sys.stderr.write(f"✅ Loaded {len(_corrections_cache)} user corrections from pickle cache\n")
+                    return _corrections_cache
+                except Exception as e:
+                    sys.stderr.write(f"⚠️ Failed to load corrections pickle cache: {e}\n")
+                    _corrections_cache = {}
+
+            if os.path.exists(corrections_path):
+                try:
+                    # Memory-map the file and parse bytes directly; avoids
+                    # double-buffering the read and feeds orjson when available
+                    with open(corrections_path, 'rb') as f:
+                        size = os.fstat(f.fileno()).st_size
+                        if size > 0:
+                            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                                content = bytes(mm).strip()
                         else:
-                            sys.stderr.write(f"⚠️ Corrections file is not a list, skipping\n")
-            except Exception as e:
-                sys.stderr.write(f"⚠️ Failed to load corrections: {e}\n")
-        else:
-            sys.stderr.write(f"💡 No corrections file found: {corrections_path}\n")
-    
+                            content = b''
+                        if content:
+                            corrections_data = _json_loads(content)
+                            if isinstance(corrections_data, list):
+                                loaded_count = 0
+                                for correction in corrections_data:
+                                    narration = correction.get("narration", "").strip()
+                                    category = correction.get("category", "").strip()
+                                    if narration and category:
+                                        # IMPORTANT: Corrections in JSON are now preprocessed using Python preprocessing_utils.
+                                        # Preprocess the narration when loading to ensure consistency.
+                                        # This ensures corrections match transactions that are also preprocessed with Python.
+                                        if PREPROCESSING_AVAILABLE:
+                                            preprocessed_narration = preprocess_upi_narration(narration, preserve_p2p_clues=True)
+                                        else:
+                                            # Fallback: use as-is
+                                            preprocessed_narration = narration.strip()
+
+                                        # Cache transaction_type/intent alongside the category
+                                        # when the correction recorded them, so a hit never
+                                        # needs a model forward just to fill those fields
+                                        tx_type = (correction.get("transaction_type") or "").strip() or None
+                                        intent = (correction.get("intent") or "").strip() or None
+
+                                        # Only store if preprocessing didn't make it empty
+                                        if preprocessed_narration and preprocessed_narration.strip():
+                                            # Store in lowercase for case-insensitive matching.
+                                            # Interned so lookups hash/compare by pointer and
+                                            # repeated merchant strings share one allocation.
+                                            key = sys.intern(preprocessed_narration.lower().strip())
+                                            _corrections_cache[key] = (sys.intern(category), tx_type, intent)
+                                            loaded_count += 1
+                                        else:
+                                            # If preprocessing made it empty, store original (fallback)
+                                            key = sys.intern(narration.lower().strip())
+                                            _corrections_cache[key] = (sys.intern(category), tx_type, intent)
+                                            loaded_count += 1
+
+                                reload_msg = " (reloaded)" if force_reload else ""
+                                sys.stderr.write(f"✅ Loaded {loaded_count} user corrections into memory{reload_msg}\n")
+
+                                if USE_PKL_CACHE:
+                                    # Persist the preprocessed dict so the next
+                                    # run can skip JSON parse + preprocessing
+                                    try:
+                                        with open(pkl_path, 'wb') as pf:
+                                            pickle.dump(_corrections_cache, pf, protocol=pickle.HIGHEST_PROTOCOL)
+                                    except Exception as e:
+                                        sys.stderr.write(f"⚠️ Failed to write corrections pickle cache: {e}\n")
+                            else:
+                                sys.stderr.write(f"⚠️ Corrections file is not a list, skipping\n")
+                except Exception as e:
+                    sys.stderr.write(f"⚠️ Failed to load corrections: {e}\n")
+            else:
+                sys.stderr.write(f"💡 No corrections file found: {corrections_path}\n")
+
     return _corrections_cache
 
 
-def get_corrected_category(description: str) -> str:
+# Memoized preprocessed forms keyed by raw narration, so the correction
+# lookup and the model path share one preprocessing pass per unique string
+_preprocess_cache = {}
+
+
+def _cached_preprocess(description: str) -> str:
     """
-    Check if description has a user correction.
-    
-    Preprocesses the description the same way the model does before lookup.
-    This ensures corrections match even if raw narration format differs.
-    
-    Args:
-        description: Transaction narration/description (raw, will be preprocessed)
-        
-    Returns:
-        Corrected category if found, None otherwise
+    Preprocess a raw narration once per unique string (memoized).
+
+    Both the correction lookup and the predictor need the same cleaned
+    form; caching here means repeat narrations (and the lookup-then-model
+    sequence for a single narration) pay for the regex pass only once.
     """
-    if not description or not description.strip():
-        return None
-    
-    corrections = load_corrections()
-    if not corrections:
-        return None
-    
-    # IMPORTANT: Corrections in JSON are already preprocessed using Python preprocessing_utils.
-    # We need to preprocess the transaction narration using the same Python preprocessing
-    # to match what's stored in corrections.
-    
+    cached = _preprocess_cache.get(description)
+    if cached is not None:
+        return cached
+
     # Preprocess transaction narration using Python preprocessing (same as corrections)
     if PREPROCESSING_AVAILABLE:
         preprocessed_desc = preprocess_upi_narration(description, preserve_p2p_clues=True)
@@ -188,29 +262,92 @@ def get_corrected_category(description: str) -> str:
         preprocessed_desc = re.sub(r'[-/]+', ' ', preprocessed_desc)
         preprocessed_desc = re.sub(r'\s+', ' ', preprocessed_desc)
         preprocessed_desc = preprocessed_desc.strip()
-    
+
     if not preprocessed_desc or not preprocessed_desc.strip():
         # If preprocessing made it empty, try original
         preprocessed_desc = description.strip()
-    
-    # Check match (case-insensitive, preprocessed using Python)
-    key = preprocessed_desc.lower().strip()
+
+    # Bound the memo so a long-running daemon can't grow it forever
+    if len(_preprocess_cache) > 4096:
+        _preprocess_cache.clear()
+    _preprocess_cache[description] = preprocessed_desc
+    return preprocessed_desc
+
+
+def _correction_key(description: str) -> str:
+    """
+    Build the lookup key for the corrections cache from a raw narration.
+    Preprocesses the same way corrections are preprocessed at load time,
+    then lowercases for case-insensitive matching.
+    """
+    # Interned to match the interned cache keys: dict probes then compare
+    # by identity instead of byte-by-byte
+    return sys.intern(_cached_preprocess(description).lower().strip())
+
+
+def _as_correction_tuple(value):
+    """
+    Normalize a corrections-cache hit to (category, transaction_type, intent).
+    Older pickle caches (and legacy JSON entries) stored bare category
+    strings; missing fields come back as None.
+    """
+    if isinstance(value, str):
+        return (value, None, None)
+    return value
+
+
+def _heuristic_transaction_type(description: str) -> str:
+    """Cheap rule used when a correction has no recorded transaction_type."""
+    return "P2P" if "/p2p/" in description.lower() else "P2C"
+
+
+def get_correction(description: str):
+    """
+    Check if description has a user correction.
+
+    Preprocesses the description the same way the model does before lookup.
+    This ensures corrections match even if raw narration format differs.
+
+    Args:
+        description: Transaction narration/description (raw, will be preprocessed)
+
+    Returns:
+        (category, transaction_type, intent) tuple if found, None otherwise.
+        transaction_type/intent are None when the correction didn't record them.
+    """
+    if not description or not description.strip():
+        return None
+
+    corrections = load_corrections()
+    if not corrections:
+        return None
+
+    # IMPORTANT: Corrections in JSON are already preprocessed using Python preprocessing_utils.
+    # We need to preprocess the transaction narration using the same Python preprocessing
+    # to match what's stored in corrections.
+    key = _correction_key(description)
     result = corrections.get(key)
     
     # Debug: Log if we have corrections but didn't find a match (helps diagnose matching issues)
     if not result and len(corrections) > 0:
         # Only log first few misses to avoid spam
-        if not hasattr(get_corrected_category, '_miss_count'):
-            get_corrected_category._miss_count = 0
-        if get_corrected_category._miss_count < 3:
+        if not hasattr(get_correction, '_miss_count'):
+            get_correction._miss_count = 0
+        if get_correction._miss_count < 3:
             sys.stderr.write(f"🔍 Correction lookup: '{description[:50]}...' -> preprocessed: '{key[:50]}...' -> NOT FOUND\n")
-            get_corrected_category._miss_count += 1
+            get_correction._miss_count += 1
             # Show sample correction keys for debugging
-            if get_corrected_category._miss_count == 1:
+            if get_correction._miss_count == 1:
                 sample_keys = list(corrections.keys())[:3]
                 sys.stderr.write(f"   Sample correction keys in cache: {[k[:50] for k in sample_keys]}\n")
-    
-    return result
+
+    return _as_correction_tuple(result) if result else None
+
+
+def get_corrected_category(description: str) -> str:
+    """Category-only view of get_correction() (kept for callers/tests)."""
+    correction = get_correction(description)
+    return correction[0] if correction else None
 
 
 def load_model():
@@ -218,26 +355,88 @@ def load_model():
     global _predictor
     
     if _predictor is None:
-        # Change to script directory to find models relative to script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        original_cwd = os.getcwd()
-        os.chdir(script_dir)
-        
+        # Resolve models relative to the script via an absolute base path
+        # instead of chdir'ing the whole process (global state, not
+        # thread-safe with the background load thread)
+        script_dir = SCRIPT_DIR
+
         try:
             # Load corrections first (fast, in-memory)
             load_corrections()
-            
+
+            # Pin torch's intra-op pool to the same physical-core count as
+            # the BLAS pools above; a single interop thread avoids dispatch
+            # overhead for a model this small
+            try:
+                import torch
+                torch.set_num_threads(_NUM_THREADS)
+                torch.set_num_interop_threads(1)
+            except (ImportError, RuntimeError):
+                # torch missing or interop pool already started; keep defaults
+                pass
+
             # Load model
-            _predictor = get_predictor()
+            try:
+                _predictor = get_predictor(base_dir=script_dir)
+            except TypeError:
+                # Older distilbert_inference without base_dir support:
+                # fall back to the chdir dance
+                original_cwd = os.getcwd()
+                os.chdir(script_dir)
+                try:
+                    _predictor = get_predictor()
+                finally:
+                    os.chdir(original_cwd)
             sys.stderr.write(f"✅ DistilBERT model loaded successfully\n")
+
+            # Prefer the int8 ONNX forward pass when an export exists
+            # (see export_to_onnx.py) and the predictor supports swapping
+            # its backend; older predictors just keep eager PyTorch.
+            onnx_int8_path = os.path.join(script_dir, 'models', 'distilbert.int8.onnx')
+            if os.path.exists(onnx_int8_path):
+                if hasattr(_predictor, 'use_onnx'):
+                    try:
+                        _predictor.use_onnx(onnx_int8_path)
+                        sys.stderr.write(f"✅ Using int8 ONNX backend: {onnx_int8_path}\n")
+                    except Exception as e:
+                        sys.stderr.write(f"⚠️ Failed to enable ONNX backend, staying on PyTorch: {e}\n")
+                else:
+                    sys.stderr.write("💡 int8 ONNX model found but predictor lacks use_onnx(); staying on PyTorch\n")
         except Exception as e:
             sys.stderr.write(f"❌ Error loading DistilBERT: {e}\n")
-            import traceback
-            sys.stderr.write(f"Traceback: {traceback.format_exc()}\n")
+            # format_exc walks and formats every frame — only pay for it
+            # when debug logging is actually on
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                import traceback
+                sys.stderr.write(f"Traceback: {traceback.format_exc()}\n")
             _predictor = None
             raise
-        finally:
-            os.chdir(original_cwd)
+
+
+def start_model_load_in_background():
+    """
+    Start load_model() on a daemon thread so model load overlaps
+    corrections loading and input parsing on the main thread.
+    """
+    global _model_load_thread
+
+    def _load():
+        global _model_load_error
+        try:
+            load_model()
+        except Exception as e:
+            _model_load_error = e
+
+    _model_load_thread = threading.Thread(target=_load, daemon=True)
+    _model_load_thread.start()
+
+
+def wait_for_model():
+    """Block until the background model load (if any) has finished."""
+    if _model_load_thread is not None:
+        _model_load_thread.join()
+    if _model_load_error is not None:
+        sys.stderr.write(f"❌ Background model load failed: {_model_load_error}\n")
 
 
 def predict(description: str) -> dict:
@@ -263,27 +462,25 @@ def predict(description: str) -> dict:
             "predicted_category": "Uncategorized",
             "predicted_subcategory": None
         }
-    
+
+    # Ensure the background model load (if started) has completed
+    wait_for_model()
+
     # STEP 1: Check user corrections first (fast in-memory lookup, preprocessed)
-    corrected_category = get_corrected_category(description)
-    if corrected_category:
+    correction = get_correction(description)
+    if correction:
+        corrected_category, transaction_type, intent = correction
         # Extract category parts
         top_category, subcategory = extract_category_parts(corrected_category)
-        
-        # Still get model prediction for transaction_type and intent
-        transaction_type = "N/A"
-        intent = "N/A"
-        if _predictor is not None:
-            try:
-                from distilbert_inference import clean_text
-                clean_desc = clean_text(description)
-                model_result = _predictor._predict_with_model(clean_desc) if clean_desc else None
-                if model_result:
-                    transaction_type = model_result.get("transaction_type", "N/A")
-                    intent = model_result.get("intent", "N/A")
-            except:
-                pass  # Ignore errors, use defaults
-        
+
+        # Corrections are deterministic: don't burn a model forward just to
+        # fill transaction_type/intent. Use the values recorded with the
+        # correction, falling back to a cheap rule for legacy entries.
+        if transaction_type is None:
+            transaction_type = _heuristic_transaction_type(description)
+        if intent is None:
+            intent = "N/A"
+
         response = {
             "description": description,
             "model_type": "User_Correction",
@@ -314,7 +511,13 @@ def predict(description: str) -> dict:
     
     # Use model's predict() which handles corrections, keywords, and model in order
     try:
-        result = _predictor.predict(description)
+        # Newer predictors accept the already-preprocessed narration and
+        # skip their internal clean_text pass (it was already paid for by
+        # the correction lookup above); older ones re-clean the raw string
+        if hasattr(_predictor, 'predict_preprocessed'):
+            result = _predictor.predict_preprocessed(_cached_preprocess(description))
+        else:
+            result = _predictor.predict(description)
         # Extract top category and subcategory from full category
         # (e.g., "Investments & Finance / Stocks & Bonds" -> "Investments & Finance" and "Stocks & Bonds")
         full_category = result.get("category", "Uncategorized")
@@ -352,8 +555,11 @@ def predict(description: str) -> dict:
         return response
     except Exception as e:
         sys.stderr.write(f"❌ DistilBERT prediction error: {e}\n")
-        import traceback
-        sys.stderr.write(f"Traceback: {traceback.format_exc()}\n")
+        # Lazy traceback: skip stack formatting unless debug logging is on,
+        # so error storms don't add tens of ms per failed prediction
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            import traceback
+            sys.stderr.write(f"Traceback: {traceback.format_exc()}\n")
         return {
             "error": str(e),
             "predicted_category": "Uncategorized",
@@ -379,7 +585,10 @@ def predict_batch(descriptions: list) -> list:
     
     # Force reload corrections to ensure latest corrections are used (important for refresh)
     corrections = load_corrections(force_reload=True)
-    
+
+    # Ensure the background model load (if started) has completed
+    wait_for_model()
+
     if _predictor is None:
         return [{
             "error": "Model not loaded",
@@ -390,9 +599,28 @@ def predict_batch(descriptions: list) -> list:
     results = []
     descriptions_for_model = []  # Narrations that need model prediction
     indices_for_model = []  # Indices of narrations that need model prediction
-    
-    # First pass: Check corrections for all descriptions
+
+    # First pass: Check corrections for all descriptions.
+    # Batch the lookup through pandas so the cache probe is a single
+    # C-level map over the whole column instead of a per-row Python call.
+    try:
+        import pandas as pd
+        keys = pd.Series(descriptions, dtype=object).map(
+            lambda d: _correction_key(d) if d and str(d).strip() else None
+        )
+        # Misses come back as NaN from the dict map; normalize to None
+        corrected = [
+            _as_correction_tuple(c) if isinstance(c, (str, tuple)) else None
+            for c in keys.map(corrections).tolist()
+        ]
+    except ImportError:
+        corrected = [
+            get_correction(desc) if desc and desc.strip() else None
+            for desc in descriptions
+        ]
+
     correction_count = 0
+    legacy_hits = []  # correction hits without recorded tx_type/intent
     for i, desc in enumerate(descriptions):
         if not desc or not desc.strip():
             results.append({
@@ -401,23 +629,29 @@ def predict_batch(descriptions: list) -> list:
                 "predicted_subcategory": None
             })
         else:
-            # Check for correction first
-            corrected_category = get_corrected_category(desc)
-            if corrected_category:
+            # Check for correction first (precomputed above)
+            correction = corrected[i]
+            if correction:
                 # Use correction
                 correction_count += 1
+                corrected_category, tx_type, intent = correction
                 top_category, subcategory = extract_category_parts(corrected_category)
                 batch_result = {
                     "description": desc,
                     "model_type": "User_Correction",
-                    "transaction_type": "N/A",
+                    "transaction_type": tx_type if tx_type is not None else _heuristic_transaction_type(desc),
                     "predicted_category": top_category,
-                    "intent": "N/A",
+                    "intent": intent if intent is not None else "N/A",
                     "confidence": {"category": 1.0},
                     "reason": "user_correction"
                 }
                 if subcategory:
                     batch_result["predicted_subcategory"] = subcategory
+                if tx_type is None or intent is None:
+                    # Legacy correction without recorded heads: piggyback on
+                    # the model batch below (free when batched) to replace
+                    # the heuristic tx_type/intent with model outputs
+                    legacy_hits.append((i, desc))
                 results.append(batch_result)
                 # Log correction usage (to stderr so it doesn't interfere with JSON output)
                 sys.stderr.write(f"✅ Using correction for: '{desc[:50]}...' -> '{top_category}'\n")
@@ -431,12 +665,45 @@ def predict_batch(descriptions: list) -> list:
         sys.stderr.write(f"📝 Applied {correction_count} corrections out of {len(descriptions)} transactions\n")
     
     # Second pass: Batch predict remaining descriptions with model
-    if descriptions_for_model:
+    batched = hasattr(_predictor, 'predict_batch')
+    if descriptions_for_model or (batched and legacy_hits):
         try:
+            # Deduplicate first: transaction batches repeat the same
+            # narration often, so predict once per unique string and
+            # scatter the result back to every occurrence
+            unique_positions = {}
+            for desc in descriptions_for_model:
+                unique_positions.setdefault(desc, len(unique_positions))
+            if batched and legacy_hits:
+                # Legacy correction hits join the same padded forward:
+                # the multi-head model produces transaction_type/intent
+                # for them as extra batch rows, not extra passes
+                for _, desc in legacy_hits:
+                    unique_positions.setdefault(desc, len(unique_positions))
+            unique_descriptions = list(unique_positions.keys())
+            if len(unique_descriptions) < len(descriptions_for_model):
+                sys.stderr.write(
+                    f"📦 Deduplicated batch: {len(unique_descriptions)} unique "
+                    f"of {len(descriptions_for_model)} model-bound narrations\n"
+                )
+
+            use_preprocessed = hasattr(_predictor, 'predict_preprocessed')
+            if batched:
+                # One padded forward over all heads for the whole batch
+                raw_results = _predictor.predict_batch(unique_descriptions)
+            else:
+                raw_results = []
+                for desc in unique_descriptions:
+                    if use_preprocessed:
+                        # Reuse the preprocessing already done for the
+                        # correction lookup in the first pass
+                        raw_results.append(_predictor.predict_preprocessed(_cached_preprocess(desc)))
+                    else:
+                        raw_results.append(_predictor.predict(desc))
+
             # Batch predict all at once (much faster)
             model_results = []
-            for desc in descriptions_for_model:
-                result = _predictor.predict(desc)
+            for desc, result in zip(unique_descriptions, raw_results):
                 full_category = result.get("category", "Uncategorized")
                 top_category, subcategory = extract_category_parts(full_category)
                 
@@ -458,10 +725,19 @@ def predict_batch(descriptions: list) -> list:
                 
                 model_results.append(batch_result)
             
-            # Fill in model results at correct indices
-            for idx, model_result in zip(indices_for_model, model_results):
-                results[idx] = model_result
-                
+            # Fill in model results at correct indices (duplicates get a
+            # copy of the unique prediction)
+            for idx, desc in zip(indices_for_model, descriptions_for_model):
+                results[idx] = dict(model_results[unique_positions[desc]])
+
+            if batched:
+                # Overlay the model-derived heads onto legacy correction
+                # hits, keeping their corrected category untouched
+                for idx, desc in legacy_hits:
+                    raw = raw_results[unique_positions[desc]]
+                    results[idx]["transaction_type"] = raw.get("transaction_type", results[idx]["transaction_type"])
+                    results[idx]["intent"] = raw.get("intent", results[idx]["intent"])
+
         except Exception as e:
             sys.stderr.write(f"❌ Batch prediction error: {e}\n")
             # Fill errors for failed predictions
@@ -475,23 +751,139 @@ def predict_batch(descriptions: list) -> list:
     return results
 
 
+def _serialize_result(result: dict) -> str:
+    """
+    Serialize a single prediction dict to JSON.
+
+    Correction hits all share a fixed schema with constant model_type /
+    confidence / reason, so splice only the variable fields around
+    precomputed fragments instead of walking the whole dict. Everything
+    else falls through to the generic encoder.
+    """
+    if (result.get("model_type") == "User_Correction"
+            and result.get("confidence") == {"category": 1.0}
+            and "all_probabilities" not in result):
+        out = (
+            '{"description":' + _json_dumps(result.get("description", ""))
+            + ',"model_type":"User_Correction"'
+            + ',"transaction_type":' + _json_dumps(result.get("transaction_type", "N/A"))
+            + ',"predicted_category":' + _json_dumps(result.get("predicted_category", "Uncategorized"))
+            + ',"intent":' + _json_dumps(result.get("intent", "N/A"))
+            + ',"confidence":{"category":1.0}'
+            + ',"reason":"user_correction"'
+        )
+        subcategory = result.get("predicted_subcategory")
+        if subcategory:
+            out += ',"predicted_subcategory":' + _json_dumps(subcategory)
+        return out + '}'
+    return _json_dumps(result)
+
+
+def _serialize_results(results: list) -> str:
+    """Serialize a batch of prediction dicts, fast-pathing correction hits."""
+    return '[' + ','.join(_serialize_result(r) for r in results) + ']'
+
+
+def handle_daemon_request(request: dict):
+    """
+    Dispatch a single daemon request by op.
+
+    Supported ops:
+    - {"op": "preprocess", "text": "..."}       -> {"result": "..."}
+    - {"op": "predict", "description": "..."}   -> prediction dict
+    - {"op": "predict_batch", "descriptions": [...]} -> list of dicts
+    """
+    op = request.get("op")
+
+    if op == "preprocess":
+        text = request.get("text", "")
+        if not text or not str(text).strip():
+            return {"result": ""}
+        if PREPROCESSING_AVAILABLE:
+            return {"result": preprocess_upi_narration(str(text), preserve_p2p_clues=True)}
+        return {"result": str(text).strip()}
+
+    if op == "predict":
+        return predict(request.get("description", ""))
+
+    if op == "predict_batch":
+        descriptions = request.get("descriptions", [])
+        if not isinstance(descriptions, list):
+            return {"error": "descriptions must be a JSON array"}
+        return predict_batch(descriptions)
+
+    return {"error": f"Unknown op: {op}"}
+
+
+def run_daemon(socket_path: str = DEFAULT_SOCKET_PATH):
+    """
+    Serve preprocess/predict requests over a Unix domain socket.
+
+    Keeps the Python process (and the loaded model) resident so Java
+    avoids ~150ms interpreter startup per narration. Protocol is
+    newline-delimited JSON: one request object per line, one response
+    per line.
+    """
+    import socket
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(5)
+    sys.stderr.write(f"🔌 Daemon listening on {socket_path}\n")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                reader = conn.makefile('rb')
+                for line in reader:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        request = _json_loads(line)
+                        response = handle_daemon_request(request)
+                    except Exception as e:
+                        response = {"error": str(e)}
+                    if isinstance(response, list):
+                        payload = _serialize_results(response)
+                    else:
+                        payload = _serialize_result(response)
+                    conn.sendall(payload.encode('utf-8') + b'\n')
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
 def main():
     """Main entry point"""
     # Load corrections and model ONCE
     try:
+        # Start model load on a daemon thread so it overlaps corrections
+        # loading and stdin/argv parsing below; predict()/predict_batch()
+        # join the thread before first model use.
+        start_model_load_in_background()
         # Load corrections first (fast, in-memory) - don't force reload on startup
         load_corrections(force_reload=False)
-        # Load model
-        load_model()
     except Exception as e:
         result = {
             "error": f"Failed to load model: {str(e)}",
             "predicted_category": "Uncategorized",
             "predicted_subcategory": None
         }
-        print(json.dumps(result), file=sys.stdout, flush=True)
+        print(_json_dumps(result), file=sys.stdout, flush=True)
         sys.exit(1)
     
+    # Daemon mode: serve requests over a Unix socket instead of one-shot argv
+    if len(sys.argv) >= 2 and sys.argv[1].strip() == "--daemon":
+        socket_path = sys.argv[2].strip() if len(sys.argv) >= 3 else DEFAULT_SOCKET_PATH
+        run_daemon(socket_path)
+        sys.exit(0)
+
     # Check if input is from stdin (batch mode with "-" argument) or command line
     if len(sys.argv) >= 2 and sys.argv[1].strip() == "-":
         # Read JSON from stdin (safer for special characters, newlines, etc.)
@@ -508,7 +900,7 @@ def main():
             results = predict_batch(descriptions)
             
             # Output JSON array to stdout
-            json_output = json.dumps(results)
+            json_output = _serialize_results(results)
             print(json_output, file=sys.stdout, flush=True)
             
             # Exit with error only if there are real errors (not just "Uncategorized")
@@ -523,7 +915,7 @@ def main():
                 "predicted_category": "Uncategorized",
                 "predicted_subcategory": None
             }
-            print(json.dumps(result), file=sys.stdout, flush=True)
+            print(_json_dumps(result), file=sys.stdout, flush=True)
             sys.exit(1)
         except Exception as e:
             result = {
@@ -531,7 +923,7 @@ def main():
                 "predicted_category": "Uncategorized",
                 "predicted_subcategory": None
             }
-            print(json.dumps(result), file=sys.stdout, flush=True)
+            print(_json_dumps(result), file=sys.stdout, flush=True)
             sys.exit(1)
     elif len(sys.argv) >= 2:
         first_arg = sys.argv[1].strip()
@@ -547,7 +939,7 @@ def main():
                 results = predict_batch(descriptions)
                 
                 # Output JSON array to stdout
-                json_output = json.dumps(results)
+                json_output = _serialize_results(results)
                 print(json_output, file=sys.stdout, flush=True)
                 
                 # Exit with error only if there are real errors (not just "Uncategorized")
@@ -562,7 +954,7 @@ def main():
                     "predicted_category": "Uncategorized",
                     "predicted_subcategory": None
                 }
-                print(json.dumps(result), file=sys.stdout, flush=True)
+                print(_json_dumps(result), file=sys.stdout, flush=True)
                 sys.exit(1)
         else:
             # Single prediction mode (backward compatible)
@@ -572,7 +964,7 @@ def main():
             result = predict(description)
             
             # Output JSON to stdout (only JSON, no other output)
-            json_output = json.dumps(result)
+            json_output = _serialize_result(result)
             print(json_output, file=sys.stdout, flush=True)
             
             # Exit with error code only if there's an actual error
@@ -587,7 +979,7 @@ def main():
             "predicted_category": "Uncategorized",
             "predicted_subcategory": None
         }
-        print(json.dumps(result), file=sys.stdout, flush=True)
+        print(_json_dumps(result), file=sys.stdout, flush=True)
         sys.exit(1)
 
 
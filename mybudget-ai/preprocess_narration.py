@@ -21,17 +21,43 @@ try:
 except ImportError:
     # Fallback: simple cleaning if preprocessing_utils not available
     import re
-    def preprocess_upi_narration(text):
+
+    # Single compiled alternation covering all cleanup rules.
+    # Compiled once at import so each narration is scanned in one pass
+    # instead of six separate re.sub calls.
+    _UPI_RE = re.compile(
+        r'(?i)'
+        r'(?P<upi>^UPI[-/])'
+        r'|(?P<tag>@[A-Z0-9]+)'
+        r'|(?P<txnid>[-/\s]*[-/]\d{9,})'
+        r'|(?P<wstxnid>\s+\d{9,})'
+        r'|(?P<sep>[-/\s])'
+    )
+    _WS2_RE = re.compile(r'\s{2,}')
+    # Final "[-/]<digits>" piece of a txnid match; whatever precedes it
+    # is an extra separator run that must survive as a space
+    _TXNID_TAIL_RE = re.compile(r'[-/]\d+$')
+
+    def _upi_replace(match):
+        kind = match.lastgroup
+        if kind == 'sep':
+            return ' '
+        if kind == 'txnid':
+            # The id and the single separator directly before it vanish,
+            # gluing the neighbouring tokens exactly like the sequential
+            # reference's '[-/]\d{9,}' -> '' pass; any extra separators
+            # ahead of that pair still collapse to one space
+            return ' ' if _TXNID_TAIL_RE.sub('', match.group('txnid')) else ''
+        # upi prefix, @tags and whitespace-led ids are dropped outright
+        return ''
+
+    def preprocess_upi_narration(text, preserve_p2p_clues=True):
         if not text:
             return ""
-        text = text.strip()
-        text = re.sub(r'(?i)^UPI[-/]', '', text)
-        text = re.sub(r'(?i)@[A-Z0-9]+', '', text)
-        text = re.sub(r'[-/]\d{9,}', '', text)
-        text = re.sub(r'\s+\d{9,}', '', text)
-        text = re.sub(r'[-/]+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        cleaned = _UPI_RE.sub(_upi_replace, text.strip())
+        # Dropped pieces can leave adjacent spaces; one collapse pass
+        # matches the old sequential pipeline's output
+        return _WS2_RE.sub(' ', cleaned).strip()
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
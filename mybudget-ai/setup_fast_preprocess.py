@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Build the optional Cython accelerator for preprocessing_utils in place.
+
+Usage:
+    python3 setup_fast_preprocess.py build_ext --inplace
+
+Requires Cython and a C compiler. The resulting _fast_preprocess
+extension is picked up automatically by preprocessing_utils; without it
+everything falls back to the pure-regex pipeline.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="budgetbuddy-fast-preprocess",
+    ext_modules=cythonize("_fast_preprocess.pyx", language_level=3),
+)